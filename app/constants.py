@@ -1,3 +1,4 @@
+from datetime import timedelta
 from enum import Enum
 
 
@@ -16,3 +17,14 @@ class TimeEnum(str, Enum):
 
     HOUR = "hour"
     DAY = "day"
+
+
+BUCKET_STEPS: dict[TimeEnum, timedelta] = {
+    TimeEnum.HOUR: timedelta(hours=1),
+    TimeEnum.DAY: timedelta(days=1),
+}
+
+# Upper bound on the buckets a single timeseries request may generate.
+MAX_TIMESERIES_BUCKETS = 10_000
+
+ERROR_LEVEL_PATTERN = f"^({'|'.join(level.value for level in ErrorLevel)})$"
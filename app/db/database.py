@@ -9,20 +9,49 @@ import app.db.models
 load_dotenv()
 
 DATABASE_URL: str = str(os.getenv("DATABASE_URL"))
-
-engine = create_async_engine(DATABASE_URL)
-
-SessionLocal = async_sessionmaker(autocommit=False, autoflush=False, bind=engine)
+DATABASE_POOL_SIZE: int = int(os.getenv("DATABASE_POOL_SIZE", "20"))
+DATABASE_MAX_OVERFLOW: int = int(os.getenv("DATABASE_MAX_OVERFLOW", "20"))
+DATABASE_POOL_TIMEOUT: int = int(os.getenv("DATABASE_POOL_TIMEOUT", "30"))
+DATABASE_POOL_RECYCLE: int = int(os.getenv("DATABASE_POOL_RECYCLE", "1800"))
+# Compiled statement cache entries, sized for every filter shape of the builders.
+DATABASE_QUERY_CACHE_SIZE: int = int(os.getenv("DATABASE_QUERY_CACHE_SIZE", "1200"))
+# PgBouncer in transaction mode cannot keep prepared statements between queries.
+DATABASE_PGBOUNCER: bool = os.getenv("DATABASE_PGBOUNCER", "false").lower() == "true"
+# Prepared statements kept per connection, by asyncpg and by the SQLAlchemy adapter.
+DATABASE_STATEMENT_CACHE_SIZE: int = (
+    0 if DATABASE_PGBOUNCER else int(os.getenv("DATABASE_STATEMENT_CACHE_SIZE", "1024"))
+)
+
+if not DATABASE_URL.startswith("postgresql+asyncpg://"):
+    raise RuntimeError("DATABASE_URL must use the postgresql+asyncpg driver")
+
+engine = create_async_engine(
+    DATABASE_URL,
+    pool_size=DATABASE_POOL_SIZE,
+    max_overflow=DATABASE_MAX_OVERFLOW,
+    pool_timeout=DATABASE_POOL_TIMEOUT,
+    pool_recycle=DATABASE_POOL_RECYCLE,
+    pool_pre_ping=True,
+    query_cache_size=DATABASE_QUERY_CACHE_SIZE,
+    connect_args={
+        "statement_cache_size": DATABASE_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": DATABASE_STATEMENT_CACHE_SIZE,
+    },
+)
+
+SessionLocal = async_sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Provide a database session for dependency injection.
 
+    The session is closed when the request finishes, returning its connection
+    to the pool even if the handler raised.
+
     Yields:
         AsyncSession: An active SQLAlchemy async session.
     """
-    db = SessionLocal()
-    try:
+    async with SessionLocal() as db:
         yield db
-    finally:
-        await db.close()
@@ -1,4 +1,13 @@
 from app.db.models.application import Application
 from app.db.models.event import Event
+from app.db.models.event_level_hourly import EventLevelHourly
+from app.db.models.event_message_hourly import EventMessageHourly
+from app.db.models.event_rollup_watermark import EventRollupWatermark
 
-__all__ = ["Application", "Event"]
+__all__ = [
+    "Application",
+    "Event",
+    "EventLevelHourly",
+    "EventMessageHourly",
+    "EventRollupWatermark",
+]
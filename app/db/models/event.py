@@ -2,9 +2,9 @@ from __future__ import annotations
 
 import typing
 
-from sqlalchemy import BigInteger, DateTime
+from sqlalchemy import BigInteger, CheckConstraint, Computed, DateTime
 from sqlalchemy import Enum as sql_Enum
-from sqlalchemy import ForeignKey, String, func
+from sqlalchemy import ForeignKey, Index, String, func, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -19,12 +19,34 @@ class Event(Base):
     """Represents a single error or log event sent by an application.
 
     Stores timestamps, severity level, message, and optional structured data
-    such as stack trace and tags.
+    such as stack trace and tags. The table is partitioned by month of
+    ``received_at``, so the primary key includes it.
     """
 
     __tablename__ = "event"
+    __table_args__ = (
+        Index(
+            "idx_event_application_id_received_at_id_level",
+            "application_id",
+            text("received_at DESC"),
+            text("id DESC"),
+            "level",
+        ),
+        Index("idx_event_application_id_occurred_at", "application_id", "occurred_at"),
+        Index(
+            "idx_event_tags",
+            "tags",
+            postgresql_using="gin",
+            postgresql_ops={"tags": "jsonb_path_ops"},
+        ),
+        CheckConstraint(
+            "occurred_at <= received_at + interval '1 day'",
+            name="ck_event_occurred_sane",
+        ),
+        {"postgresql_partition_by": "RANGE (received_at)"},
+    )
 
-    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     application_id: Mapped[int] = mapped_column(
         BigInteger, ForeignKey("application.id", ondelete="CASCADE"), nullable=False
     )
@@ -32,13 +54,22 @@ class Event(Base):
         DateTime(timezone=True), nullable=False
     )
     received_at: Mapped[DateTime] = mapped_column(
-        DateTime(timezone=True), nullable=False, server_default=func.now()
+        DateTime(timezone=True), primary_key=True, server_default=func.now()
     )
     level: Mapped[ErrorLevel] = mapped_column(
-        sql_Enum(ErrorLevel, name="error_lvl", create_type=False),
+        sql_Enum(
+            ErrorLevel,
+            name="error_lvl",
+            create_type=False,
+            native_enum=True,
+            values_callable=lambda levels: [level.value for level in levels],
+        ),
         nullable=False,
     )
     message: Mapped[str] = mapped_column(String(255), nullable=False)
+    message_hash: Mapped[int] = mapped_column(
+        BigInteger, Computed("hashtextextended(message, 0)", persisted=True)
+    )
 
     stack: Mapped[JSONB] = mapped_column(JSONB)
     tags: Mapped[JSONB] = mapped_column(JSONB)
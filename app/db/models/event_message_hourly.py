@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from sqlalchemy import BigInteger, DateTime
+from sqlalchemy import Enum as sql_Enum
+from sqlalchemy import ForeignKey, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.constants import ErrorLevel
+from app.db.models.base import Base
+
+
+class EventMessageHourly(Base):
+    """Hourly per-message event counts used by the top messages statistics.
+
+    Rows are inserted once per closed hour by ``event_rollup_hours``, buckets are
+    UTC hours of ``received_at``.
+    """
+
+    __tablename__ = "event_message_hourly"
+
+    application_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("application.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    bucket_hour: Mapped[DateTime] = mapped_column(
+        DateTime(timezone=True), primary_key=True
+    )
+    level: Mapped[ErrorLevel] = mapped_column(
+        sql_Enum(
+            ErrorLevel,
+            name="error_lvl",
+            create_type=False,
+            native_enum=True,
+            values_callable=lambda levels: [level.value for level in levels],
+        ),
+        primary_key=True,
+    )
+    message: Mapped[str] = mapped_column(String(255), primary_key=True)
+    count: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    last_seen: Mapped[DateTime] = mapped_column(DateTime(timezone=True), nullable=False)
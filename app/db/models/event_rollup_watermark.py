@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from sqlalchemy import Boolean, DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.models.base import Base
+
+
+class EventRollupWatermark(Base):
+    """Single row marking how far the hourly rollups are complete.
+
+    Hours before ``rolled_up_until`` are read from the rollup tables, later ones
+    from ``event``. The watermark is advanced by ``event_rollup_hours``.
+    """
+
+    __tablename__ = "event_rollup_watermark"
+
+    id: Mapped[bool] = mapped_column(Boolean, primary_key=True, default=True)
+    rolled_up_until: Mapped[DateTime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
@@ -1,7 +1,67 @@
-from fastapi import FastAPI
+import asyncio
+import contextlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator
 
+import anyio.to_thread
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.db.database import engine
 from app.routers.app_router import app_router
+from app.services.maintenance import run_event_maintenance
+from app.tools.exception_handlers import error_response_handler
+from app.tools.logger import logger
+
+THREAD_POOL_SIZE: int = int(os.getenv("THREAD_POOL_SIZE", "40"))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+    """Size worker thread pools and open a database connection before serving.
+
+    Sync dependencies run on the anyio thread limiter and blocking loop calls
+    (e.g. DNS lookups when opening connections) on the default executor. A
+    ``SELECT 1`` leaves a warm connection in the pool, so the first request
+    does not pay for connecting; if the database is not up yet this is only
+    logged and connections are opened on demand. ``event`` partitions and
+    rollups are maintained by a background task while the application runs.
+
+    Args:
+        app: FastAPI application instance.
+    """
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREAD_POOL_SIZE
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=THREAD_POOL_SIZE)
+    )
+
+    try:
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
+    except (OSError, SQLAlchemyError):
+        logger.warning("Database is not reachable yet, skipping connection warm-up")
+
+    maintenance = asyncio.create_task(run_event_maintenance())
+
+    yield
+
+    maintenance.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await maintenance
+
+    await engine.dispose()
+
 
-app = FastAPI(title="Log Handler")
+app = FastAPI(
+    title="Log Handler",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
 
+app.add_exception_handler(HTTPException, error_response_handler)
 app.include_router(app_router)
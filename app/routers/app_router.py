@@ -1,10 +1,12 @@
-from typing import Annotated
+from typing import Annotated, AsyncIterator
 
+import orjson
 from annotated_types import Gt, MinLen
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.engine import RowMapping
 from sqlalchemy.exc import IntegrityError, NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
-from starlette.responses import JSONResponse
 
 from app.db.database import get_db
 from app.routers.event_router import event_router
@@ -19,16 +21,34 @@ app_router.include_router(status_router)
 app_router.include_router(event_router)
 
 
+async def _stream_json_array(rows: AsyncIterator[RowMapping]) -> AsyncIterator[bytes]:
+    """Encode rows as a JSON array, one element per chunk.
+
+    Args:
+        rows: Row mappings to encode.
+
+    Yields:
+        Chunks of the JSON array.
+    """
+    separator = b"["
+    async for row in rows:
+        yield separator + orjson.dumps(dict(row), option=orjson.OPT_UTC_Z)
+        separator = b","
+
+    yield b"[]" if separator == b"[" else b"]"
+
+
 @app_router.post(
     "/{name}",
     response_model=ApplicationCreationResponse,
     response_model_exclude_none=True,
+    responses={status.HTTP_409_CONFLICT: {"model": ErrorResponse}},
     status_code=status.HTTP_201_CREATED,
 )
 async def application_creation(
     name: Annotated[str, MinLen(1)],
     db: AsyncSession = Depends(get_db),
-) -> ApplicationCreationResponse | JSONResponse:
+) -> ApplicationCreationResponse:
     """Create a new application.
 
     Args:
@@ -36,17 +56,21 @@ async def application_creation(
         db: Database session dependency.
 
     Returns:
-        Created application data or conflict error response if name already exists.
+        Created application data.
+
+    Raises:
+        HTTPException: 409 if an application with this name already exists.
     """
     try:
         return await DataBaseManager(db).create_application(name)
 
     except IntegrityError:
-        return JSONResponse(
+        raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
-            content=ErrorResponse(
-                error="CONFLICT", message="application with this name already exists"
-            ).model_dump(),
+            detail={
+                "error": "CONFLICT",
+                "message": "application with this name already exists",
+            },
         )
 
 
@@ -54,12 +78,13 @@ async def application_creation(
     "/{app_id}",
     response_model=ApplicationRead,
     response_model_exclude_none=True,
+    responses={status.HTTP_404_NOT_FOUND: {"model": ErrorResponse}},
     status_code=status.HTTP_200_OK,
 )
 async def read_single_application(
     app_id: Annotated[int, Gt(0)],
     db: AsyncSession = Depends(get_db),
-) -> ApplicationRead | JSONResponse:
+) -> ApplicationRead:
     """Retrieve a single application by ID.
 
     Args:
@@ -67,35 +92,44 @@ async def read_single_application(
         db: Database session dependency.
 
     Returns:
-        Application data or error response if application does not exist.
+        Application data.
+
+    Raises:
+        HTTPException: 404 if the application does not exist.
     """
     try:
         return await DataBaseManager(db).read_app_by_id(app_id)
 
     except NoResultFound:
-        return JSONResponse(
+        raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            content=ErrorResponse(
-                error="ERROR", message="application with this id does not exist"
-            ).model_dump(),
+            detail={
+                "error": "ERROR",
+                "message": "application with this id does not exist",
+            },
         )
 
 
 @app_router.get(
     "/",
-    response_model=list[ApplicationRead],
-    response_model_exclude_none=True,
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": list[ApplicationRead]}},
     status_code=status.HTTP_200_OK,
 )
 async def read_all_applications(
     db: AsyncSession = Depends(get_db),
-) -> list[ApplicationRead]:
+) -> StreamingResponse:
     """Retrieve all registered applications.
 
+    The JSON array is streamed while rows are read from the database.
+
     Args:
         db: Database session dependency.
 
     Returns:
-        List of applications.
+        Streamed list of applications.
     """
-    return await DataBaseManager(db).read_all_apps()
+    return StreamingResponse(
+        _stream_json_array(DataBaseManager(db).stream_all_apps()),
+        media_type="application/json",
+    )
@@ -3,69 +3,249 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Annotated
 
-from annotated_types import Ge, Gt, Le
-from fastapi import APIRouter, Depends, Header, status
-from sqlalchemy.exc import NoResultFound
+from annotated_types import Ge, Gt, Le, Len
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from fastapi.responses import Response
+from pydantic import TypeAdapter
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import IntegrityError, NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
-from starlette.responses import JSONResponse
 
 from app.constants import ErrorLevel
 from app.db.database import get_db
 from app.schemas.error_response import ErrorResponse
+from app.schemas.event_batch_creation_output import EventBatchCreationOutput
 from app.schemas.event_creation_input import EventCreationInput
 from app.schemas.event_creation_output import EventCreationOutput
 from app.schemas.event_list import EventList
 from app.schemas.event_read import EventRead
 from app.services.db_menager import DataBaseManager
-from app.tools.custom_exceptions import IngestForbiddenError
+from app.services.ingest_auth import ingest_auth_cache
+from app.tools.cursor import decode_cursor, encode_cursor
+from app.tools.custom_exceptions import (
+    IngestForbiddenError,
+    InvalidCursorError,
+    InvalidTagFilterError,
+)
+from app.tools.tag_filter import parse_tag_filters
 
 event_router = APIRouter(tags=["Events"])
 
+_EVENT_LIST_ADAPTER = TypeAdapter(list[EventRead])
+
+_OCCURRED_AT_CONSTRAINT = "ck_event_occurred_sane"
+
+
+def _integrity_error(exc: IntegrityError) -> HTTPException:
+    """Translate an ingest ``IntegrityError`` into a 400 response.
+
+    Only a violation of ``ck_event_occurred_sane`` is reported as a future
+    ``occurred_at``; other violations, e.g. the application foreign key after
+    the application was deleted, get a generic message.
+
+    Args:
+        exc: Error raised by the INSERT.
+
+    Returns:
+        HTTP exception to raise.
+    """
+    # asyncpg's error, which carries the constraint name, is the adapter's cause.
+    constraint = getattr(exc.orig.__cause__, "constraint_name", None)
+
+    if constraint == _OCCURRED_AT_CONSTRAINT:
+        message = "occurred_at is more than a day in the future"
+    else:
+        message = "event rejected by the database"
+
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail={"error": "ERROR", "message": message},
+    )
+
+
+async def _authorize_ingest(
+    manager: DataBaseManager, app_id: int, ingest_key: str
+) -> None:
+    """Verify ingest credentials, consulting the in-process cache first.
+
+    Args:
+        manager: Database manager bound to the request session.
+        app_id: Application identifier.
+        ingest_key: Ingest authentication key from request header.
+
+    Raises:
+        IngestForbiddenError: If application does not exist or ingest key is invalid.
+    """
+    authorized = ingest_auth_cache.lookup(app_id, ingest_key)
+
+    if authorized is None:
+        try:
+            await manager.verify_ingest_key(app_id, ingest_key)
+        except IngestForbiddenError:
+            ingest_auth_cache.remember(app_id, ingest_key, False)
+            raise
+
+        ingest_auth_cache.remember(app_id, ingest_key, True)
+
+    elif not authorized:
+        raise IngestForbiddenError
+
+
+async def _create_authorized_event(
+    manager: DataBaseManager,
+    app_id: int,
+    payload: EventCreationInput,
+    ingest_key: str,
+) -> Row:
+    """Create an event, verifying uncached credentials within the INSERT.
+
+    Args:
+        manager: Database manager bound to the request session.
+        app_id: Application identifier.
+        payload: Event creation payload.
+        ingest_key: Ingest authentication key from request header.
+
+    Returns:
+        Row with ``id``, ``application_id`` and ``received_at`` of the event.
+
+    Raises:
+        IngestForbiddenError: If application does not exist or ingest key is invalid.
+    """
+    authorized = ingest_auth_cache.lookup(app_id, ingest_key)
+
+    if authorized:
+        return await manager.create_event(app_id, payload)
+
+    if authorized is not None:
+        raise IngestForbiddenError
+
+    try:
+        event = await manager.create_event(app_id, payload, ingest_key)
+    except IngestForbiddenError:
+        ingest_auth_cache.remember(app_id, ingest_key, False)
+        raise
+
+    ingest_auth_cache.remember(app_id, ingest_key, True)
+    return event
+
 
 @event_router.get(
     "/{app_id}/events",
-    response_model=EventList,
-    response_model_exclude_none=True,
+    response_model=None,
+    responses={
+        status.HTTP_200_OK: {"model": EventList},
+        status.HTTP_400_BAD_REQUEST: {"model": ErrorResponse},
+        status.HTTP_404_NOT_FOUND: {"model": ErrorResponse},
+    },
     status_code=status.HTTP_200_OK,
 )
 async def get_events_by_application_id(
     app_id: int,
     limit: Annotated[int, Gt(0), Le(50)],
-    offset: Annotated[int, Ge(0)],
-    level: ErrorLevel | None = None,
+    cursor: str | None = None,
+    level: Annotated[list[ErrorLevel] | None, Query()] = None,
     since: datetime | None = None,
     until: datetime | None = None,
+    tag: Annotated[list[str] | None, Query()] = None,
+    exact: bool = False,
+    offset: Annotated[int | None, Ge(0), Query(deprecated=True)] = None,
     db: AsyncSession = Depends(get_db),
-) -> EventList | JSONResponse:
+) -> Response:
     """Retrieve paginated events for a specific application.
 
-    Supports filtering by error level and time range.
+    Supports filtering by error level, time range and tags. Pagination is keyset
+    based: pass ``next_cursor`` from the previous page as ``cursor``. Items are
+    validated once when read from the database rows and the ``EventList`` is
+    serialized directly, skipping FastAPI's response model validation.
 
     Args:
         app_id: Application identifier.
         limit: Maximum number of events to return.
-        offset: Pagination offset.
-        level: Optional error level filter.
+        cursor: Optional cursor returned with the previous page.
+        level: Optional error level filter, repeat to match several levels.
         since: Optional lower bound for received time.
         until: Optional upper bound for received time.
+        tag: Optional tag filters as ``key:value`` or bare ``key``, repeat to
+            combine; repeated keys match any of their values.
+        exact: Return an exact ``total`` instead of the planner estimate
+            ``approx_total``. Either is only returned on the first page, without
+            ``cursor`` or ``offset``.
+        offset: Deprecated offset pagination, ignored when ``cursor`` is given.
         db: Database session dependency.
 
     Returns:
-        Event list with next offset or error response if application is not found.
+        Serialized ``EventList`` with next cursor.
+
+    Raises:
+        HTTPException: 400 if the cursor or a tag filter is invalid, 404 if the
+            application is not found.
     """
     try:
-        events = await DataBaseManager(db).read_events_by_application_id(
-            app_id, limit, offset, level, since, until
+        manager = DataBaseManager(db)
+        tags = parse_tag_filters(tag) if tag else None
+        events = await manager.read_events_by_application_id(
+            app_id,
+            limit,
+            decode_cursor(cursor) if cursor else None,
+            level,
+            since,
+            until,
+            tags,
+            offset,
+        )
+        converted_items = _EVENT_LIST_ADAPTER.validate_python(events)
+        has_next = len(events) == limit
+        next_cursor = (
+            encode_cursor(events[-1]["received_at"], events[-1]["id"])
+            if has_next
+            else None
+        )
+        next_offset = (
+            offset + limit if has_next and offset is not None and not cursor else None
+        )
+        total = approx_total = None
+        # Cursor and offset pages continue a listing whose first page had the total.
+        first_page = cursor is None and not offset
+
+        if first_page and exact:
+            total = await manager.count_events(app_id, level, since, until, tags)
+        elif first_page:
+            approx_total = await manager.approx_count_events(
+                app_id, level, since, until, tags
+            )
+
+        result = EventList.model_construct(
+            items=converted_items,
+            next_cursor=next_cursor,
+            next_offset=next_offset,
+            total=total,
+            approx_total=approx_total,
+        )
+
+        return Response(
+            content=result.model_dump_json(exclude_none=True),
+            media_type="application/json",
+        )
+
+    except InvalidCursorError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"error": "ERROR", "message": "invalid cursor"},
+        )
+
+    except InvalidTagFilterError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"error": "ERROR", "message": "invalid tag filter"},
         )
-        converted_items = [EventRead.model_validate(event) for event in events]
-        return EventList(items=converted_items, next_offset=offset + limit)
 
     except NoResultFound:
-        return JSONResponse(
+        raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            content=ErrorResponse(
-                error="ERROR", message="event with this application id does not exist"
-            ).model_dump(),
+            detail={
+                "error": "ERROR",
+                "message": "event with this application id does not exist",
+            },
         )
 
 
@@ -73,6 +253,10 @@ async def get_events_by_application_id(
     "/{app_id}/events",
     response_model=EventCreationOutput,
     response_model_exclude_none=True,
+    responses={
+        status.HTTP_400_BAD_REQUEST: {"model": ErrorResponse},
+        status.HTTP_403_FORBIDDEN: {"model": ErrorResponse},
+    },
     status_code=status.HTTP_201_CREATED,
 )
 async def create_event(
@@ -80,9 +264,13 @@ async def create_event(
     payload: EventCreationInput,
     ingest_key: str = Header(..., alias="X-INGEST-KEY"),
     db: AsyncSession = Depends(get_db),
-) -> EventCreationOutput | JSONResponse:
+) -> EventCreationOutput:
     """Create a new event for an application using ingest authentication.
 
+    Recent verification outcomes are served from an in-process cache; on a
+    cache miss the credentials are verified by the INSERT itself, so either way
+    the event is created in at most one round trip.
+
     Args:
         app_id: Application identifier.
         payload: Event creation payload.
@@ -90,15 +278,74 @@ async def create_event(
         db: Database session dependency.
 
     Returns:
-        Created event data or error response if ingest validation fails.
+        Created event data.
+
+    Raises:
+        HTTPException: 403 if ingest validation fails, 400 if the database
+            rejects the event (e.g. ``occurred_at`` too far in the future).
     """
     try:
-        return await DataBaseManager(db).create_event(app_id, payload, ingest_key)
+        return await _create_authorized_event(
+            DataBaseManager(db), app_id, payload, ingest_key
+        )
 
     except IngestForbiddenError:
-        return JSONResponse(
+        raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
-            content=ErrorResponse(
-                error="ERROR", message="Invalid application or ingest key"
-            ).model_dump(),
+            detail={"error": "ERROR", "message": "Invalid application or ingest key"},
         )
+
+    except IntegrityError as exc:
+        raise _integrity_error(exc)
+
+
+@event_router.post(
+    "/{app_id}/events:batch",
+    response_model=EventBatchCreationOutput,
+    response_model_exclude_none=True,
+    responses={
+        status.HTTP_400_BAD_REQUEST: {"model": ErrorResponse},
+        status.HTTP_403_FORBIDDEN: {"model": ErrorResponse},
+    },
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_events_batch(
+    app_id: int,
+    payload: Annotated[list[EventCreationInput], Len(1, 1000)],
+    ingest_key: str = Header(..., alias="X-INGEST-KEY"),
+    db: AsyncSession = Depends(get_db),
+) -> EventBatchCreationOutput:
+    """Create up to 1000 events for an application in a single request.
+
+    The ingest key is verified once for the whole batch and all events are
+    inserted in one transaction.
+
+    Args:
+        app_id: Application identifier.
+        payload: Event creation payloads.
+        ingest_key: Ingest authentication key from request header.
+        db: Database session dependency.
+
+    Returns:
+        Number and id range of created events.
+
+    Raises:
+        HTTPException: 403 if ingest validation fails, 400 if the database
+            rejects an event (e.g. ``occurred_at`` too far in the future).
+    """
+    try:
+        manager = DataBaseManager(db)
+        await _authorize_ingest(manager, app_id, ingest_key)
+        event_ids = await manager.create_events_bulk(app_id, payload)
+        return EventBatchCreationOutput(
+            inserted=len(event_ids), first_id=min(event_ids), last_id=max(event_ids)
+        )
+
+    except IngestForbiddenError:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={"error": "ERROR", "message": "Invalid application or ingest key"},
+        )
+
+    except IntegrityError as exc:
+        raise _integrity_error(exc)
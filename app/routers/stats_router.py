@@ -4,25 +4,29 @@ from datetime import datetime
 from typing import Annotated
 
 from annotated_types import Ge, Gt, Le
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from starlette.responses import JSONResponse
 
-from app.constants import ErrorLevel, TimeEnum
+from app.constants import BUCKET_STEPS, MAX_TIMESERIES_BUCKETS, ErrorLevel, TimeEnum
 from app.db.database import get_db
 from app.schemas.by_level_output import ByLevelItem, ByLevelOutput
 from app.schemas.error_response import ErrorResponse
 from app.schemas.timeseries_output import Series, TimeseriesOutput
 from app.schemas.top_messages_output import TopMessageItem, TopMessagesOutput
 from app.services.db_menager import DataBaseManager
+from app.tools.timestamps import as_utc
 
 status_router = APIRouter(tags=["Status"])
 
 
 @status_router.get(
     "/{app_id}/stats/timeseries",
-    response_model=TimeseriesOutput,
-    response_model_exclude_none=True,
+    response_model=None,
+    responses={
+        status.HTTP_200_OK: {"model": TimeseriesOutput},
+        status.HTTP_400_BAD_REQUEST: {"model": ErrorResponse},
+    },
     status_code=status.HTTP_200_OK,
 )
 async def get_timeseries(
@@ -30,9 +34,9 @@ async def get_timeseries(
     since: datetime,
     until: datetime,
     interval: TimeEnum = TimeEnum.HOUR,
-    level: ErrorLevel | None = None,
+    level: Annotated[list[ErrorLevel] | None, Query()] = None,
     db: AsyncSession = Depends(get_db),
-) -> TimeseriesOutput | JSONResponse:
+) -> Response:
     """Return time-bucketed event counts for an application.
 
     Args:
@@ -40,44 +44,62 @@ async def get_timeseries(
         since: Lower bound for received time.
         until: Upper bound for received time.
         interval: Bucket size (e.g., hour/day).
-        level: Optional error level filter.
+        level: Optional error level filter, repeat to match several levels.
         db: Database session dependency.
 
     Returns:
-        Timeseries response or validation error response when time range is invalid.
+        Serialized timeseries response.
+
+    Raises:
+        HTTPException: 400 if the time range is invalid or spans more than
+            ``MAX_TIMESERIES_BUCKETS`` buckets.
     """
+    since, until = as_utc(since), as_utc(until)
+
     if since >= until:
-        return JSONResponse(
+        raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            content=ErrorResponse(
-                error="CONFLICT", message="since must be earlier than until"
-            ).model_dump(),
+            detail={"error": "CONFLICT", "message": "since must be earlier than until"},
         )
+
+    # The series starts at the bucket containing since and includes until.
+    if (until - since) // BUCKET_STEPS[interval] + 2 > MAX_TIMESERIES_BUCKETS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "error": "ERROR",
+                "message": f"range spans more than {MAX_TIMESERIES_BUCKETS} buckets",
+            },
+        )
+
     result = await DataBaseManager(db).read_bucket_stats_list(
         app_id, since, until, interval, level
     )
-    return TimeseriesOutput(
+    output = TimeseriesOutput.model_construct(
         interval=interval,
         since=since,
         until=until,
-        series=[
-            Series(bucket_start=bucket_start, count=count)
-            for bucket_start, count in result
-        ],
+        series=[Series.model_construct(**row) for row in result],
+    )
+    return Response(
+        content=output.model_dump_json(exclude_none=True), media_type="application/json"
     )
 
 
 @status_router.get(
     "/{app_id}/stats/by-level",
-    response_model=ByLevelOutput,
-    response_model_exclude_none=True,
+    response_model=None,
+    responses={
+        status.HTTP_200_OK: {"model": ByLevelOutput},
+        status.HTTP_400_BAD_REQUEST: {"model": ErrorResponse},
+    },
 )
 async def get_by_level(
     app_id: Annotated[int, Gt(0)],
     since: datetime,
     until: datetime,
     db: AsyncSession = Depends(get_db),
-) -> ByLevelOutput | JSONResponse:
+) -> Response:
     """Return event counts grouped by severity level for an application.
 
     Args:
@@ -87,38 +109,47 @@ async def get_by_level(
         db: Database session dependency.
 
     Returns:
-        By-level distribution or validation error response when time range is invalid.
+        Serialized by-level distribution.
+
+    Raises:
+        HTTPException: 400 if the time range is invalid.
     """
+    since, until = as_utc(since), as_utc(until)
+
     if since >= until:
-        return JSONResponse(
+        raise HTTPException(
             status_code=400,
-            content=ErrorResponse(
-                error="CONFLICT", message="since must be earlier than until"
-            ).model_dump(),
+            detail={"error": "CONFLICT", "message": "since must be earlier than until"},
         )
 
     rows = await DataBaseManager(db).read_stats_by_level(app_id, since, until)
 
-    return ByLevelOutput(
+    output = ByLevelOutput.model_construct(
         since=since,
         until=until,
-        items=[ByLevelItem(level=level, count=count) for level, count in rows],
+        items=[ByLevelItem.model_construct(**row) for row in rows],
+    )
+    return Response(
+        content=output.model_dump_json(exclude_none=True), media_type="application/json"
     )
 
 
 @status_router.get(
     "/{app_id}/stats/top-messages",
-    response_model=TopMessagesOutput,
-    response_model_exclude_none=True,
+    response_model=None,
+    responses={
+        status.HTTP_200_OK: {"model": TopMessagesOutput},
+        status.HTTP_400_BAD_REQUEST: {"model": ErrorResponse},
+    },
 )
 async def get_top_messages(
     app_id: Annotated[int, Gt(0)],
     since: datetime,
     until: datetime,
     limit: Annotated[int, Ge(1), Le(100)] = 10,
-    level: ErrorLevel | None = None,
+    level: Annotated[list[ErrorLevel] | None, Query()] = None,
     db: AsyncSession = Depends(get_db),
-) -> TopMessagesOutput | JSONResponse:
+) -> Response:
     """Return the most frequent event messages for an application.
 
     Args:
@@ -126,28 +157,31 @@ async def get_top_messages(
         since: Lower bound for received time.
         until: Upper bound for received time.
         limit: Maximum number of messages to return.
-        level: Optional error level filter.
+        level: Optional error level filter, repeat to match several levels.
         db: Database session dependency.
 
     Returns:
-        Top messages response or validation error response when time range is invalid.
+        Serialized top messages response.
+
+    Raises:
+        HTTPException: 400 if the time range is invalid.
     """
+    since, until = as_utc(since), as_utc(until)
+
     if since >= until:
-        return JSONResponse(
+        raise HTTPException(
             status_code=400,
-            content=ErrorResponse(
-                error="CONFLICT", message="since must be earlier than until"
-            ).model_dump(),
+            detail={"error": "CONFLICT", "message": "since must be earlier than until"},
         )
 
     rows = await DataBaseManager(db).read_top_messages(
         app_id, since, until, limit, level
     )
 
-    return TopMessagesOutput(
+    output = TopMessagesOutput.model_construct(
         limit=limit,
-        items=[
-            TopMessageItem(message=msg, count=count, last_seen=last_seen)
-            for msg, count, last_seen in rows
-        ],
+        items=[TopMessageItem.model_construct(**row) for row in rows],
+    )
+    return Response(
+        content=output.model_dump_json(exclude_none=True), media_type="application/json"
     )
@@ -1,14 +1,14 @@
 from datetime import datetime
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
-from app.constants import ErrorLevel
+from app.constants import ERROR_LEVEL_PATTERN
 
 
 class ByLevelItem(BaseModel):
     """Single severity-level aggregate item."""
 
-    level: ErrorLevel
+    level: str = Field(pattern=ERROR_LEVEL_PATTERN)
     count: int
 
 
@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+from pydantic import BaseModel
+
+
+class EventBatchCreationOutput(BaseModel):
+    """Response schema returned after successful batch event creation."""
+
+    inserted: int
+    first_id: int
+    last_id: int
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from app.schemas.event_read import EventRead
 
@@ -9,6 +9,11 @@ class EventList(BaseModel):
     """Paginated list of events."""
 
     items: list["EventRead"]
-    next_offset: int | None = None
+    next_cursor: str | None = None
+    total: int | None = None
+    approx_total: int | None = None
+    next_offset: int | None = Field(
+        default=None, deprecated="Use next_cursor for pagination instead."
+    )
 
     model_config = {"from_attributes": True}
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-from datetime import date, datetime
+from datetime import datetime
 from typing import Any, Dict, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
-from app.constants import ErrorLevel
+from app.constants import ERROR_LEVEL_PATTERN
 
 
 class EventRead(BaseModel):
@@ -15,7 +15,7 @@ class EventRead(BaseModel):
     application_id: int
     occurred_at: datetime
     received_at: datetime
-    level: ErrorLevel
+    level: str = Field(pattern=ERROR_LEVEL_PATTERN)
     message: str
     stack: Optional[Dict[str, Any]] = None
     tags: Optional[Dict[str, Any]] = None
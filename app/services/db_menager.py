@@ -1,30 +1,536 @@
 from __future__ import annotations
 
+import json
 import secrets
-from datetime import datetime
-from typing import Any
-
-from sqlalchemy import func, select
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import product
+from typing import Any, AsyncIterator, Sequence
+
+from sqlalchemy import (
+    BigInteger,
+    DateTime,
+    Interval,
+    Select,
+    String,
+    Text,
+    and_,
+    bindparam,
+    cast,
+    column,
+    exists,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    tuple_,
+    text,
+    type_coerce,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.engine import Row, RowMapping
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.ext.asyncio import AsyncSession
-
-from app.constants import ErrorLevel, TimeEnum
-from app.db.models import Event
+from sqlalchemy.sql.expression import ClauseElement, Executable
+from sqlalchemy.sql.visitors import InternalTraversal
+
+from app.constants import BUCKET_STEPS, ErrorLevel, TimeEnum
+from app.db.models import (
+    Event,
+    EventLevelHourly,
+    EventMessageHourly,
+    EventRollupWatermark,
+)
 from app.db.models.application import Application
 from app.schemas.event_creation_input import EventCreationInput
 from app.tools.custom_exceptions import IngestForbiddenError
 from app.tools.logger import logger
+from app.tools.timestamps import as_utc
+
+
+def _floor_hour(moment: datetime) -> datetime:
+    """Return the start of the UTC hour containing the timestamp."""
+    return as_utc(moment).replace(minute=0, second=0, microsecond=0)
+
+
+def _ceil_hour(moment: datetime) -> datetime:
+    """Return the first UTC hour boundary at or after the timestamp."""
+    start = _floor_hour(moment)
+    return start if start == as_utc(moment) else start + timedelta(hours=1)
+
+
+class _Explain(Executable, ClauseElement):
+    """``EXPLAIN (FORMAT JSON)`` of a statement, executed with its bind parameters.
+
+    The wrapped statement is compiled and cached like any other, so request
+    values are never rendered into the SQL text.
+    """
+
+    inherit_cache = True
+    _traverse_internals = [("statement", InternalTraversal.dp_clauseelement)]
+
+    def __init__(self, statement: Select):
+        self.statement = statement
+
+
+@compiles(_Explain)
+def _compile_explain(element: _Explain, compiler: Any, **kw: Any) -> str:
+    """Render ``_Explain`` as ``EXPLAIN (FORMAT JSON)`` followed by the statement."""
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+def _json_or_none(document: dict[str, Any] | None) -> str | None:
+    """Serialize an optional JSON document, keeping None as SQL NULL."""
+    return None if document is None else json.dumps(document)
+
+
+_INSERT_EVENTS_UNNEST = text("""
+    INSERT INTO event (application_id, occurred_at, level, message, stack, tags)
+    SELECT :app_id, occurred_at, level, message, stack, tags
+    FROM unnest(
+        :occurred_at,
+        CAST(:level AS error_lvl[]),
+        :message,
+        CAST(:stack AS jsonb[]),
+        CAST(:tags AS jsonb[])
+    ) AS batch(occurred_at, level, message, stack, tags)
+    RETURNING id
+    """).bindparams(
+    bindparam("app_id", type_=BigInteger),
+    bindparam("occurred_at", type_=ARRAY(DateTime(timezone=True))),
+    bindparam("level", type_=ARRAY(Text)),
+    bindparam("message", type_=ARRAY(Text)),
+    bindparam("stack", type_=ARRAY(Text)),
+    bindparam("tags", type_=ARRAY(Text)),
+)
+
+
+def _tags_conditions(tags: dict[str, list[Any]]) -> list[Any]:
+    """Build JSONB conditions for tag filters.
+
+    Keys are combined with AND, values of a single key with OR. Value filters
+    are ``tags @> ...`` containments so they can use the GIN index; a key with
+    no values only requires the key to be present (``tags ? key``).
+
+    Args:
+        tags: Mapping of tag key to the list of accepted values.
+
+    Returns:
+        List of SQLAlchemy boolean expressions for WHERE clause.
+    """
+    required = {key: values[0] for key, values in tags.items() if len(values) == 1}
+    conditions: list[Any] = []
+
+    if required:
+        conditions.append(Event.tags.contains(required))
+
+    for key, values in tags.items():
+        if not values:
+            conditions.append(Event.tags.has_key(key))
+
+        elif len(values) > 1:
+            conditions.append(
+                or_(*(Event.tags.contains({key: value}) for value in values))
+            )
+
+    return conditions
+
+
+def _levels_shape(levels: Sequence[ErrorLevel] | None) -> int:
+    """Classify a levels filter as absent (0), single (1) or multiple (2)."""
+    return min(len(levels), 2) if levels else 0
+
+
+def _levels_params(levels: Sequence[ErrorLevel] | None) -> dict[str, Any]:
+    """Return bind parameter values for the level condition."""
+    if not levels:
+        return {}
+
+    if len(levels) == 1:
+        return {"level": levels[0]}
+
+    return {"levels": list(levels)}
+
+
+def _level_conditions(level_column: Any, levels_shape: int) -> list[Any]:
+    """Build the error level condition for a level column.
+
+    Args:
+        level_column: Level column to filter on.
+        levels_shape: Shape of the filter as returned by ``_levels_shape``.
+
+    Returns:
+        List with a single SQLAlchemy boolean expression, empty when unfiltered.
+    """
+    # No predicate when unfiltered, an "OR :level IS NULL" guard defeats the index.
+    if levels_shape == 0:
+        return []
+
+    if levels_shape == 1:
+        return [level_column == bindparam("level")]
+
+    return [level_column.in_(bindparam("levels", expanding=True))]
+
+
+def _event_conditions(levels_shape: int, has_since: bool, has_until: bool) -> list[Any]:
+    """Build WHERE conditions for event queries with bind parameter placeholders.
+
+    Args:
+        levels_shape: Shape of the level filter as returned by ``_levels_shape``.
+        has_since: Whether the lower bound for received time is filtered.
+        has_until: Whether the upper bound for received time is filtered.
+
+    Returns:
+        List of SQLAlchemy boolean expressions for WHERE clause.
+    """
+    conditions: list[Any] = [
+        Event.application_id == bindparam("app_id"),
+        *_level_conditions(Event.level, levels_shape),
+    ]
+
+    if has_since:
+        conditions.append(Event.received_at >= bindparam("since"))
+
+    if has_until:
+        conditions.append(Event.received_at <= bindparam("until"))
+
+    return conditions
+
+
+def _event_params(
+    app_id: int,
+    levels: Sequence[ErrorLevel] | None,
+    since: datetime | None,
+    until: datetime | None,
+) -> dict[str, Any]:
+    """Return bind parameter values for ``_event_conditions``.
+
+    Time bounds are normalized to aware UTC values, naive ones are taken as UTC
+    instead of depending on the session time zone.
+    """
+    params: dict[str, Any] = {"app_id": app_id, **_levels_params(levels)}
+
+    if since:
+        params["since"] = as_utc(since)
+
+    if until:
+        params["until"] = as_utc(until)
+
+    return params
 
 
+def _level_label(level_column: Any) -> Any:
+    """Select a level column as its plain label, skipping ``ErrorLevel`` conversion.
+
+    Args:
+        level_column: ``error_lvl`` column to select.
+
+    Returns:
+        Column expression labelled ``level`` that reads as ``str``.
+    """
+    return type_coerce(level_column, String).label("level")
+
+
+_EVENT_READ_COLUMNS = (
+    Event.__table__.c.id,
+    Event.__table__.c.application_id,
+    Event.__table__.c.occurred_at,
+    Event.__table__.c.received_at,
+    _level_label(Event.__table__.c.level),
+    Event.__table__.c.message,
+    Event.__table__.c.stack,
+    Event.__table__.c.tags,
+)
+
+
+@lru_cache(maxsize=None)
+def _events_page_stmt(
+    levels_shape: int,
+    has_since: bool,
+    has_until: bool,
+    has_cursor: bool,
+    has_offset: bool = False,
+) -> Select:
+    """Build the paginated event listing query for a filter shape.
+
+    Pages are selected by the ``(received_at, id)`` keyset cursor; ``has_offset``
+    adds the deprecated OFFSET instead. Only the ``EventRead`` columns are
+    selected from the table, so rows are not loaded as ORM instances.
+    """
+    conditions = _event_conditions(levels_shape, has_since, has_until)
+
+    if has_cursor:
+        conditions.append(
+            tuple_(Event.received_at, Event.id)
+            < tuple_(
+                bindparam("cursor_received_at", type_=DateTime(timezone=True)),
+                bindparam("cursor_id", type_=BigInteger),
+            )
+        )
+
+    stmt = (
+        select(*_EVENT_READ_COLUMNS)
+        .where(*conditions)
+        .order_by(Event.received_at.desc(), Event.id.desc())
+        .limit(bindparam("limit"))
+    )
+
+    if has_offset:
+        stmt = stmt.offset(bindparam("offset"))
+
+    return stmt
+
+
+@lru_cache(maxsize=None)
+def _events_count_stmt(levels_shape: int, has_since: bool, has_until: bool) -> Select:
+    """Build the exact event count query for a filter shape."""
+    return select(func.count(Event.id)).where(
+        *_event_conditions(levels_shape, has_since, has_until)
+    )
+
+
+@lru_cache(maxsize=None)
+def _events_ids_stmt(levels_shape: int, has_since: bool, has_until: bool) -> Select:
+    """Build the event id query used for planner estimates for a filter shape."""
+    return select(Event.id).where(
+        *_event_conditions(levels_shape, has_since, has_until)
+    )
+
+
+def _rollup_window(since: datetime, until: datetime) -> dict[str, datetime]:
+    """Return the whole UTC hours inside a range as rollup bind parameters.
+
+    Args:
+        since: Lower bound for received time.
+        until: Upper bound for received time.
+
+    Returns:
+        ``rollup_since`` and ``rollup_until`` values, empty when the range does
+        not contain a whole hour.
+    """
+    rollup_since = _ceil_hour(since)
+    rollup_until = _floor_hour(until)
+
+    if rollup_since >= rollup_until:
+        return {}
+
+    return {"rollup_since": rollup_since, "rollup_until": rollup_until}
+
+
+def _rollup_until() -> Any:
+    """Return the end of the rollup window, capped at the rollup watermark.
+
+    Hours from the watermark on (at least the current hour) are not rolled up
+    yet, so they are read from ``event`` like the partial hours at the edges.
+    """
+    rollup_since = bindparam("rollup_since", type_=DateTime(timezone=True))
+    rolled_up_until = select(EventRollupWatermark.rolled_up_until).scalar_subquery()
+
+    return func.least(
+        bindparam("rollup_until", type_=DateTime(timezone=True)),
+        func.greatest(rollup_since, rolled_up_until),
+    )
+
+
+def _rollup_conditions(rollup: Any, levels_shape: int) -> list[Any]:
+    """Build WHERE conditions selecting the rollup window of an hourly rollup.
+
+    Args:
+        rollup: Hourly rollup model.
+        levels_shape: Shape of the level filter as returned by ``_levels_shape``.
+
+    Returns:
+        List of SQLAlchemy boolean expressions for WHERE clause.
+    """
+    return [
+        rollup.application_id == bindparam("app_id"),
+        *_level_conditions(rollup.level, levels_shape),
+        rollup.bucket_hour >= bindparam("rollup_since", type_=DateTime(timezone=True)),
+        rollup.bucket_hour < _rollup_until(),
+    ]
+
+
+def _raw_conditions(levels_shape: int, use_rollup: bool) -> list[Any]:
+    """Build WHERE conditions for the part of a range read from ``event``.
+
+    With ``use_rollup`` only the partial hours before ``rollup_since`` and the
+    hours from the capped ``rollup_until`` on are selected, otherwise the whole
+    range.
+
+    Args:
+        levels_shape: Shape of the level filter as returned by ``_levels_shape``.
+        use_rollup: Whether whole hours are read from a rollup.
+
+    Returns:
+        List of SQLAlchemy boolean expressions for WHERE clause.
+    """
+    if not use_rollup:
+        return _event_conditions(levels_shape, True, True)
+
+    since = bindparam("since", type_=DateTime(timezone=True))
+    until = bindparam("until", type_=DateTime(timezone=True))
+    rollup_since = bindparam("rollup_since", type_=DateTime(timezone=True))
+    rollup_until = _rollup_until()
+
+    return [
+        *_event_conditions(levels_shape, False, False),
+        or_(
+            and_(Event.received_at >= since, Event.received_at < rollup_since),
+            and_(Event.received_at >= rollup_until, Event.received_at <= until),
+        ),
+    ]
+
+
+@lru_cache(maxsize=None)
+def _bucket_stats_stmt(levels_shape: int, use_rollup: bool) -> Select:
+    """Build the zero-filled time bucket query for a filter shape.
+
+    Buckets are UTC hours or days, matching the hourly rollup boundaries. The
+    series is stepped in UTC as well, so daily steps do not drift with daylight
+    saving time in the session time zone.
+    """
+    interval = bindparam("interval", type_=String)
+    bucket_expr = func.date_trunc(interval, Event.received_at, "UTC")
+    parts = [
+        select(
+            bucket_expr.label("bucket_start"),
+            func.count(Event.id).label("count"),
+        )
+        .where(*_raw_conditions(levels_shape, use_rollup))
+        .group_by(bucket_expr)
+    ]
+
+    if use_rollup:
+        rollup_bucket_expr = func.date_trunc(
+            interval, EventLevelHourly.bucket_hour, "UTC"
+        )
+        parts.append(
+            select(
+                rollup_bucket_expr.label("bucket_start"),
+                func.sum(EventLevelHourly.count).label("count"),
+            )
+            .where(*_rollup_conditions(EventLevelHourly, levels_shape))
+            .group_by(rollup_bucket_expr)
+        )
+
+    parts_query = union_all(*parts).subquery("parts")
+    counts = (
+        select(
+            parts_query.c.bucket_start,
+            cast(func.sum(parts_query.c.count), BigInteger).label("count"),
+        )
+        .group_by(parts_query.c.bucket_start)
+        .subquery("counts")
+    )
+
+    buckets = (
+        func.generate_series(
+            func.date_trunc(
+                interval, bindparam("since", type_=DateTime(timezone=True)), "UTC"
+            ),
+            bindparam("until", type_=DateTime(timezone=True)),
+            bindparam("step", type_=Interval()),
+            "UTC",
+        )
+        .table_valued(column("bucket_start", DateTime(timezone=True)))
+        .render_derived(name="buckets")
+    )
+
+    return (
+        select(
+            buckets.c.bucket_start,
+            func.coalesce(counts.c.count, 0).label("count"),
+        )
+        .select_from(
+            buckets.outerjoin(counts, counts.c.bucket_start == buckets.c.bucket_start)
+        )
+        .order_by(buckets.c.bucket_start)
+    )
+
+
+@lru_cache(maxsize=None)
+def _stats_by_level_stmt(use_rollup: bool) -> Select:
+    """Build the per-level event count query."""
+    parts = [
+        select(
+            _level_label(Event.level),
+            func.count(Event.id).label("count"),
+        )
+        .where(*_raw_conditions(0, use_rollup))
+        .group_by(Event.level)
+    ]
+
+    if use_rollup:
+        parts.append(
+            select(
+                _level_label(EventLevelHourly.level),
+                func.sum(EventLevelHourly.count).label("count"),
+            )
+            .where(*_rollup_conditions(EventLevelHourly, 0))
+            .group_by(EventLevelHourly.level)
+        )
+
+    counts = union_all(*parts).subquery("counts")
+    count = cast(func.sum(counts.c.count), BigInteger).label("count")
+
+    return select(counts.c.level, count).group_by(counts.c.level).order_by(count.desc())
+
+
+@lru_cache(maxsize=None)
+def _top_messages_stmt(levels_shape: int, use_rollup: bool) -> Select:
+    """Build the top messages query for a level filter shape.
+
+    With ``use_rollup`` rolled up hours between ``rollup_since`` and
+    ``rollup_until`` are read from ``event_message_hourly``, the rest from
+    ``event``.
+    """
+    # Raw rows are grouped by the fixed-width message hash; min() picks the text.
+    parts = [
+        select(
+            func.min(Event.message).label("message"),
+            func.count(Event.id).label("count"),
+            func.max(Event.received_at).label("last_seen"),
+        )
+        .where(*_raw_conditions(levels_shape, use_rollup))
+        .group_by(Event.message_hash)
+    ]
+
+    if use_rollup:
+        parts.append(
+            select(
+                EventMessageHourly.message,
+                EventMessageHourly.count,
+                EventMessageHourly.last_seen,
+            ).where(*_rollup_conditions(EventMessageHourly, levels_shape))
+        )
+
+    counts = union_all(*parts).subquery("counts")
+    count = cast(func.sum(counts.c.count), BigInteger).label("count")
+    last_seen = func.max(counts.c.last_seen).label("last_seen")
+
+    return (
+        select(counts.c.message, count, last_seen)
+        .group_by(counts.c.message)
+        .order_by(count.desc(), last_seen.desc())
+        .limit(bindparam("limit"))
+    )
+
+
+@dataclass(slots=True)
 class DataBaseManager:
-    """Database access layer for application and event operations."""
+    """Database access layer for application and event operations.
 
-    def __init__(self, db: AsyncSession):
-        """Create a new database manager.
+    A thin wrapper around the request session; statements are built by the
+    cached module-level builders, so construction does no work per request.
 
-        Args:
-            db: SQLAlchemy async session.
-        """
-        self.db = db
+    Attributes:
+        db: SQLAlchemy async session.
+    """
+
+    db: AsyncSession
 
     async def _read_by_id(self, model: Any, obj_id: int) -> Any | None:
         """Read a single row by primary key.
@@ -51,109 +557,227 @@ class DataBaseManager:
         """
         return await self._read_by_id(Application, app_id)
 
-    @staticmethod
-    def _create_event_where_condition(
+    async def read_events_by_application_id(
+        self,
         app_id: int,
-        since: datetime | None,
-        until: datetime | None,
-        level: ErrorLevel | None,
-    ) -> list[Any]:
-        """Build WHERE conditions for event queries.
+        limit: int,
+        cursor: tuple[datetime, int] | None = None,
+        levels: Sequence[ErrorLevel] | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        tags: dict[str, list[Any]] | None = None,
+        offset: int | None = None,
+    ) -> Sequence[RowMapping]:
+        """Read a page of events for an application using keyset pagination.
+
+        Events are ordered from newest to oldest by ``(received_at, id)``.
+        ``offset`` is only honoured without a cursor and is kept for clients
+        of the deprecated offset pagination; it scans all skipped rows.
 
         Args:
             app_id: Application identifier.
+            limit: Maximum number of rows to return.
+            cursor: Optional ``(received_at, id)`` of the last row of the previous page.
+            levels: Optional error levels filter.
             since: Optional lower bound for received time.
             until: Optional upper bound for received time.
-            level: Optional error level filter.
+            tags: Optional mapping of tag key to the list of accepted values.
+            offset: Optional number of rows to skip (deprecated).
 
         Returns:
-            List of SQLAlchemy boolean expressions for WHERE clause.
+            Event rows as mappings of column name to value.
         """
-        where_conditions: list[Any] = [Event.application_id == app_id]
+        use_offset = not cursor and bool(offset)
+        stmt = _events_page_stmt(
+            _levels_shape(levels), bool(since), bool(until), bool(cursor), use_offset
+        )
+        params = _event_params(app_id, levels, since, until) | {"limit": limit}
 
-        if level:
-            where_conditions.append(Event.level == level)
+        if cursor:
+            cursor_received_at, params["cursor_id"] = cursor
+            params["cursor_received_at"] = as_utc(cursor_received_at)
 
-        if since:
-            where_conditions.append(Event.occurred_at >= since)
+        if use_offset:
+            params["offset"] = offset
 
-        if until:
-            where_conditions.append(Event.occurred_at <= until)
+        if tags:
+            stmt = stmt.where(*_tags_conditions(tags))
 
-        return where_conditions
+        results = await self.db.execute(stmt, params)
+        return results.mappings().all()
 
-    async def read_events_by_application_id(
+    async def count_events(
         self,
         app_id: int,
-        limit: int,
-        offset: int,
-        level: ErrorLevel | None = None,
+        levels: Sequence[ErrorLevel] | None = None,
         since: datetime | None = None,
         until: datetime | None = None,
-    ) -> list[Event]:
-        """Read paginated events for an application.
+        tags: dict[str, list[Any]] | None = None,
+    ) -> int:
+        """Count events matching the filters exactly.
 
         Args:
             app_id: Application identifier.
-            limit: Maximum number of rows to return.
-            offset: Pagination offset.
-            level: Optional error level filter.
+            levels: Optional error levels filter.
             since: Optional lower bound for received time.
             until: Optional upper bound for received time.
+            tags: Optional mapping of tag key to the list of accepted values.
 
         Returns:
-            List of event ORM instances.
+            Number of matching events.
         """
-        where_conditions = self._create_event_where_condition(
-            app_id, since, until, level
+        stmt = _events_count_stmt(_levels_shape(levels), bool(since), bool(until))
+
+        if tags:
+            stmt = stmt.where(*_tags_conditions(tags))
+
+        result = await self.db.execute(
+            stmt, _event_params(app_id, levels, since, until)
         )
+        return result.scalar_one()
 
-        stmt = (
-            select(Event)
-            .where(*where_conditions)
-            .limit(limit)
-            .offset(offset)
-            .order_by(Event.occurred_at.desc())
+    async def approx_count_events(
+        self,
+        app_id: int,
+        levels: Sequence[ErrorLevel] | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        tags: dict[str, list[Any]] | None = None,
+    ) -> int:
+        """Estimate the number of matching events from the query planner.
+
+        Runs ``EXPLAIN`` instead of ``COUNT(*)``, so the cost does not grow with
+        the size of the event table.
+
+        Args:
+            app_id: Application identifier.
+            levels: Optional error levels filter.
+            since: Optional lower bound for received time.
+            until: Optional upper bound for received time.
+            tags: Optional mapping of tag key to the list of accepted values.
+
+        Returns:
+            Planner row estimate for the matching events.
+        """
+        stmt = _events_ids_stmt(_levels_shape(levels), bool(since), bool(until))
+
+        if tags:
+            stmt = stmt.where(*_tags_conditions(tags))
+
+        result = await self.db.execute(
+            _Explain(stmt), _event_params(app_id, levels, since, until)
         )
+        plan = result.scalar_one()
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    async def verify_ingest_key(self, app_id: int, ingest_key: str) -> None:
+        """Verify that the ingest key belongs to the application.
+
+        Args:
+            app_id: Application identifier.
+            ingest_key: Ingest key provided by the client.
 
+        Raises:
+            IngestForbiddenError: If application does not exist or ingest key is invalid.
+        """
+        stmt = select(Application.id).where(
+            Application.id == app_id, Application.ingest_key == ingest_key
+        )
         results = await self.db.execute(stmt)
-        return results.scalars().all()
+
+        if results.scalar_one_or_none() is None:
+            raise IngestForbiddenError
 
     async def create_event(
         self,
         app_id: int,
         payload: EventCreationInput,
-        ingest_key: str,
-    ) -> Event | None:
-        """Create a new event after verifying ingest credentials.
+        ingest_key: str | None = None,
+    ) -> Row:
+        """Create a new event in a single INSERT ... RETURNING round trip.
+
+        With ``ingest_key`` the row is inserted from a SELECT guarded by an
+        ``EXISTS`` check on the application credentials, so verification and
+        insert share one statement. Without it, credentials must have been
+        checked beforehand (e.g. served from the ingest auth cache).
 
         Args:
             app_id: Application identifier.
             payload: Event payload.
-            ingest_key: Ingest key provided by the client.
+            ingest_key: Optional ingest key to verify within the insert.
 
         Returns:
-            Created event ORM instance.
+            Row with ``id``, ``application_id`` and ``received_at`` of the event.
 
         Raises:
-            IngestForbiddenError: If application does not exist or ingest key is invalid.
+            IngestForbiddenError: If ``ingest_key`` is given and does not belong
+                to the application.
         """
-        stmt = select(Application).where(
-            Application.id == app_id, Application.ingest_key == ingest_key
+        values = payload.model_dump(exclude_none=True)
+        source = select(
+            literal(app_id, BigInteger),
+            *(
+                literal(value, Event.__table__.c[name].type)
+                for name, value in values.items()
+            ),
         )
-        results = await self.db.execute(stmt)
-        app = results.scalar_one_or_none()
 
-        if not app:
+        if ingest_key is not None:
+            source = source.where(
+                exists().where(
+                    Application.id == app_id, Application.ingest_key == ingest_key
+                )
+            )
+
+        stmt = (
+            insert(Event)
+            .from_select(["application_id", *values], source)
+            .returning(Event.id, Event.application_id, Event.received_at)
+        )
+        result = await self.db.execute(stmt)
+        event = result.one_or_none()
+
+        if event is None:
             raise IngestForbiddenError
 
-        event = Event(application_id=app_id, **payload.model_dump(exclude_none=True))
-        self.db.add(event)
         await self.db.commit()
-        await self.db.refresh(event)
-        return await self._read_by_id(Event, event.id)
+        return event
 
-    async def create_application(self, app_name: str) -> Application | None:
+    async def create_events_bulk(
+        self,
+        app_id: int,
+        payloads: list[EventCreationInput],
+    ) -> list[int]:
+        """Create many events in a single transaction.
+
+        Each column is bound as one array and expanded with ``unnest`` in a
+        single INSERT ... SELECT ... RETURNING, so the statement and its
+        parameter count do not depend on the batch size. Ingest credentials
+        must be checked beforehand with ``verify_ingest_key``.
+
+        Args:
+            app_id: Application identifier.
+            payloads: Event payloads.
+
+        Returns:
+            Identifiers of the created events.
+        """
+        results = await self.db.execute(
+            _INSERT_EVENTS_UNNEST,
+            {
+                "app_id": app_id,
+                "occurred_at": [payload.occurred_at for payload in payloads],
+                "level": [payload.level.value for payload in payloads],
+                "message": [payload.message for payload in payloads],
+                "stack": [_json_or_none(payload.stack) for payload in payloads],
+                "tags": [_json_or_none(payload.tags) for payload in payloads],
+            },
+        )
+        event_ids = results.scalars().all()
+        await self.db.commit()
+        return event_ids
+
+    async def create_application(self, app_name: str) -> Application:
         """Create a new application with a generated ingest key.
 
         Args:
@@ -162,22 +786,32 @@ class DataBaseManager:
         Returns:
             Created application ORM instance.
         """
-        ingest_key = secrets.token_hex(16)
+        ingest_key = secrets.token_urlsafe(24)
         app = Application(name=app_name, ingest_key=ingest_key)
-        logger.info(f"Adding {app_name} application")
+        logger.info("Adding %s application", app_name)
         self.db.add(app)
         await self.db.commit()
         await self.db.refresh(app)
-        return await self._read_by_id(Application, app.id)
+        return app
 
-    async def read_all_apps(self) -> list[Application]:
-        """Read all applications.
+    async def stream_all_apps(self) -> AsyncIterator[RowMapping]:
+        """Stream all applications without their ingest keys.
 
-        Returns:
-            List of application ORM instances.
+        Rows are fetched from a server-side cursor in batches, so memory does
+        not grow with the number of applications.
+
+        Yields:
+            Row mappings with ``id``, ``name`` and ``created_at`` keys.
         """
-        result = await self.db.execute(select(Application))
-        return result.scalars().all()
+        stmt = (
+            select(Application.id, Application.name, Application.created_at)
+            .order_by(Application.id)
+            .execution_options(yield_per=500)
+        )
+        result = await self.db.stream(stmt)
+
+        async for row in result.mappings():
+            yield row
 
     async def read_bucket_stats_list(
         self,
@@ -185,67 +819,63 @@ class DataBaseManager:
         since: datetime,
         until: datetime,
         interval: TimeEnum,
-        level: ErrorLevel | None,
-    ):
+        levels: Sequence[ErrorLevel] | None,
+    ) -> Sequence[RowMapping]:
         """Return time-bucketed counts for an application.
 
+        Buckets are generated by PostgreSQL for the whole range, so buckets
+        without events are returned with a zero count. Closed UTC hours are
+        read from the ``event_level_hourly`` rollup, the partial hours at both
+        ends and the hours not rolled up yet are counted from ``event``.
+
         Args:
             app_id: Application identifier.
             since: Lower bound for received time.
             until: Upper bound for received time.
             interval: Bucket size (e.g., hour/day).
-            level: Optional error level filter.
-        """
-        where_conditions = self._create_event_where_condition(
-            app_id, since, until, level
-        )
+            levels: Optional error levels filter.
 
-        bucket_expr = func.date_trunc(interval.value, Event.occurred_at).label(
-            "bucket_start"
-        )
-
-        stmt = (
-            select(
-                bucket_expr,
-                func.count(Event.id).label("count"),
-            )
-            .where(*where_conditions)
-            .group_by(bucket_expr)
-            .order_by(bucket_expr)
-        )
+        Returns:
+            Row mappings with ``bucket_start`` and ``count`` keys.
+        """
+        rollup_window = _rollup_window(since, until)
+        stmt = _bucket_stats_stmt(_levels_shape(levels), bool(rollup_window))
+        params = _event_params(app_id, levels, since, until) | {
+            "interval": interval.value,
+            "step": BUCKET_STEPS[interval],
+            **rollup_window,
+        }
 
-        result = await self.db.execute(stmt)
-        return result.all()
+        result = await self.db.execute(stmt, params)
+        return result.mappings().all()
 
     async def read_stats_by_level(
         self,
         app_id: int,
         since: datetime,
         until: datetime,
-    ):
+    ) -> Sequence[RowMapping]:
         """Return event counts grouped by severity level.
 
+        Closed UTC hours are read from the ``event_level_hourly`` rollup, the
+        partial hours at both ends and the hours not rolled up yet are counted
+        from ``event``.
+
         Args:
             app_id: Application identifier.
             since: Lower bound for received time.
             until: Upper bound for received time.
+
+        Returns:
+            Row mappings with ``level`` and ``count`` keys.
         """
-        where_conditions = self._create_event_where_condition(
-            app_id, since, until, level=None
-        )
+        rollup_window = _rollup_window(since, until)
+        params = _event_params(app_id, None, since, until) | rollup_window
 
-        stmt = (
-            select(
-                Event.level.label("level"),
-                func.count(Event.id).label("count"),
-            )
-            .where(*where_conditions)
-            .group_by(Event.level)
-            .order_by(func.count(Event.id).desc())
+        result = await self.db.execute(
+            _stats_by_level_stmt(bool(rollup_window)), params
         )
-
-        result = await self.db.execute(stmt)
-        return result.all()
+        return result.mappings().all()
 
     async def read_top_messages(
         self,
@@ -253,32 +883,52 @@ class DataBaseManager:
         since: datetime,
         until: datetime,
         limit: int,
-        level: ErrorLevel | None,
-    ):
+        levels: Sequence[ErrorLevel] | None,
+    ) -> Sequence[RowMapping]:
         """Return the most frequent messages with their counts and last seen time.
 
+        Closed UTC hours inside the range are read from the ``event_message_hourly``
+        rollup, the partial hours at both ends and the hours not rolled up yet are
+        aggregated from ``event``.
+
         Args:
             app_id: Application identifier.
             since: Lower bound for received time.
             until: Upper bound for received time.
             limit: Maximum number of messages to return.
-            level: Optional error level filter.
+            levels: Optional error levels filter.
+
+        Returns:
+            Row mappings with ``message``, ``count`` and ``last_seen`` keys.
         """
-        where_conditions = self._create_event_where_condition(
-            app_id, since, until, level
+        rollup_window = _rollup_window(since, until)
+        stmt = _top_messages_stmt(_levels_shape(levels), bool(rollup_window))
+        params = (
+            _event_params(app_id, levels, since, until)
+            | {"limit": limit}
+            | rollup_window
         )
 
-        stmt = (
-            select(
-                Event.message.label("message"),
-                func.count(Event.id).label("count"),
-                func.max(Event.occurred_at).label("last_seen"),
-            )
-            .where(*where_conditions)
-            .group_by(Event.message)
-            .order_by(func.count(Event.id).desc(), func.max(Event.occurred_at).desc())
-            .limit(limit)
-        )
+        result = await self.db.execute(stmt, params)
+        return result.mappings().all()
 
-        result = await self.db.execute(stmt)
-        return result.all()
+
+def _prime_statement_cache() -> None:
+    """Build every statement shape once so no request pays for constructing it."""
+    for levels_shape in range(3):
+        for flags in product((False, True), repeat=4):
+            _events_page_stmt(levels_shape, *flags)
+
+        for has_since, has_until in product((False, True), repeat=2):
+            _events_count_stmt(levels_shape, has_since, has_until)
+            _events_ids_stmt(levels_shape, has_since, has_until)
+
+        for use_rollup in (False, True):
+            _bucket_stats_stmt(levels_shape, use_rollup)
+            _top_messages_stmt(levels_shape, use_rollup)
+
+    for use_rollup in (False, True):
+        _stats_by_level_stmt(use_rollup)
+
+
+_prime_statement_cache()
@@ -0,0 +1,110 @@
+import hashlib
+import time
+from collections import OrderedDict
+
+INGEST_AUTH_TTL_SECONDS: float = 60
+INGEST_AUTH_MAX_ENTRIES: int = 4096
+INGEST_AUTH_MAX_REJECTED_ENTRIES: int = 1024
+
+
+class IngestAuthCache:
+    """In-process cache of recently verified ingest credentials.
+
+    Both accepted and rejected credentials are cached, so repeated requests
+    with a wrong key do not reach the database either. Entries are keyed by
+    application id and a BLAKE2b digest of the ingest key, so raw secrets are
+    never kept in memory. Accepted and rejected credentials are kept in
+    separate LRUs, so a client trying random keys only evicts other rejections
+    and never the credentials of legitimate ingesters.
+    """
+
+    def __init__(
+        self,
+        ttl: float = INGEST_AUTH_TTL_SECONDS,
+        max_entries: int = INGEST_AUTH_MAX_ENTRIES,
+        max_rejected_entries: int = INGEST_AUTH_MAX_REJECTED_ENTRIES,
+    ):
+        """Create an empty cache.
+
+        Args:
+            ttl: Number of seconds a verification stays valid.
+            max_entries: Maximum number of cached accepted credentials.
+            max_rejected_entries: Maximum number of cached rejected credentials.
+        """
+        self._ttl = ttl
+        self._accepted: OrderedDict[tuple[int, bytes], float] = OrderedDict()
+        self._rejected: OrderedDict[tuple[int, bytes], float] = OrderedDict()
+        self._max_entries = {True: max_entries, False: max_rejected_entries}
+
+    @staticmethod
+    def _key(app_id: int, ingest_key: str) -> tuple[int, bytes]:
+        """Build the cache key for a credential pair.
+
+        Args:
+            app_id: Application identifier.
+            ingest_key: Ingest key provided by the client.
+
+        Returns:
+            Tuple of application id and ingest key digest.
+        """
+        return app_id, hashlib.blake2b(ingest_key.encode(), digest_size=16).digest()
+
+    def _entries(self, authorized: bool) -> OrderedDict[tuple[int, bytes], float]:
+        """Return the LRU holding outcomes of one kind.
+
+        Args:
+            authorized: Whether the LRU of accepted credentials is requested.
+
+        Returns:
+            Mapping of cache key to the moment the entry expires.
+        """
+        return self._accepted if authorized else self._rejected
+
+    def lookup(self, app_id: int, ingest_key: str) -> bool | None:
+        """Look up a recent verification outcome for the credentials.
+
+        Args:
+            app_id: Application identifier.
+            ingest_key: Ingest key provided by the client.
+
+        Returns:
+            True or False for a non-expired cached outcome, None if unknown.
+        """
+        key = self._key(app_id, ingest_key)
+
+        for authorized in (True, False):
+            entries = self._entries(authorized)
+            valid_until = entries.get(key)
+
+            if valid_until is None:
+                continue
+
+            if valid_until < time.monotonic():
+                del entries[key]
+                return None
+
+            entries.move_to_end(key)
+            return authorized
+
+        return None
+
+    def remember(self, app_id: int, ingest_key: str, authorized: bool) -> None:
+        """Cache a verification outcome.
+
+        Args:
+            app_id: Application identifier.
+            ingest_key: Ingest key verified against the database.
+            authorized: Whether the key belongs to the application.
+        """
+        key = self._key(app_id, ingest_key)
+        self._entries(not authorized).pop(key, None)
+
+        entries = self._entries(authorized)
+        entries[key] = time.monotonic() + self._ttl
+        entries.move_to_end(key)
+
+        if len(entries) > self._max_entries[authorized]:
+            entries.popitem(last=False)
+
+
+ingest_auth_cache = IngestAuthCache()
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import asyncio
+import os
+from datetime import timedelta
+from typing import Any
+
+from sqlalchemy import Interval, TextClause, bindparam, text
+
+from app.db.database import engine
+from app.tools.logger import logger
+
+EVENT_MAINTENANCE_INTERVAL_SECONDS: float = float(
+    os.getenv("EVENT_MAINTENANCE_INTERVAL_SECONDS", "60")
+)
+# Grace period for ingest transactions still in flight when their hour ends.
+EVENT_ROLLUP_SETTLE_SECONDS: int = int(os.getenv("EVENT_ROLLUP_SETTLE_SECONDS", "300"))
+EVENT_PARTITION_MONTHS_AHEAD: int = int(os.getenv("EVENT_PARTITION_MONTHS_AHEAD", "3"))
+
+_CREATE_PARTITIONS = text(
+    "SELECT event_create_partitions(now(), now() + make_interval(months => :months))"
+)
+_ROLLUP_HOURS = text("SELECT event_rollup_hours(:settle)").bindparams(
+    bindparam("settle", type_=Interval())
+)
+
+
+async def _run_step(name: str, stmt: TextClause, params: dict[str, Any]) -> None:
+    """Run one maintenance statement in its own transaction, logging failures.
+
+    Args:
+        name: Step name used in the log message.
+        stmt: Statement to execute.
+        params: Bind parameter values.
+    """
+    try:
+        async with engine.begin() as connection:
+            await connection.execute(stmt, params)
+
+    except Exception:
+        logger.exception("Event maintenance step %s failed", name)
+
+
+async def run_event_maintenance() -> None:
+    """Periodically maintain ``event`` partitions and rollups until cancelled.
+
+    Each run creates the monthly partitions for the next
+    ``EVENT_PARTITION_MONTHS_AHEAD`` months, so long running deployments never
+    write a new month into ``event_default``, and rolls up closed hours. Both
+    functions are safe to run from several application processes at once.
+    Failures are logged and retried on the next run.
+    """
+    settle = timedelta(seconds=EVENT_ROLLUP_SETTLE_SECONDS)
+
+    while True:
+        await _run_step(
+            "partitions", _CREATE_PARTITIONS, {"months": EVENT_PARTITION_MONTHS_AHEAD}
+        )
+        await _run_step("rollup", _ROLLUP_HOURS, {"settle": settle})
+        await asyncio.sleep(EVENT_MAINTENANCE_INTERVAL_SECONDS)
@@ -0,0 +1,48 @@
+import base64
+from datetime import datetime
+
+from app.tools.custom_exceptions import InvalidCursorError
+
+# Event ids are BIGINT, anything outside the signed 64-bit range is tampered with.
+_MIN_EVENT_ID = -(2**63)
+_MAX_EVENT_ID = 2**63 - 1
+
+
+def encode_cursor(received_at: datetime, event_id: int) -> str:
+    """Encode the position of the last returned event as an opaque cursor.
+
+    Args:
+        received_at: Received time of the last returned event.
+        event_id: Identifier of the last returned event.
+
+    Returns:
+        URL-safe base64 encoded ``received_at|id`` string.
+    """
+    raw = f"{received_at.isoformat()}|{event_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Decode a cursor produced by ``encode_cursor``.
+
+    Args:
+        cursor: Opaque pagination cursor.
+
+    Returns:
+        Tuple of received time and event identifier.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or its id is out of range.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        raw_received_at, raw_event_id = raw.split("|")
+        received_at = datetime.fromisoformat(raw_received_at)
+        event_id = int(raw_event_id)
+    except ValueError as exc:
+        raise InvalidCursorError from exc
+
+    if not _MIN_EVENT_ID <= event_id <= _MAX_EVENT_ID:
+        raise InvalidCursorError
+
+    return received_at, event_id
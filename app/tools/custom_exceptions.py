@@ -1,2 +1,10 @@
 class IngestForbiddenError(Exception):
     pass
+
+
+class InvalidCursorError(Exception):
+    pass
+
+
+class InvalidTagFilterError(Exception):
+    pass
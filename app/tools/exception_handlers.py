@@ -0,0 +1,25 @@
+from fastapi import HTTPException, Request
+from fastapi.exception_handlers import http_exception_handler
+from fastapi.responses import ORJSONResponse, Response
+
+
+async def error_response_handler(request: Request, exc: HTTPException) -> Response:
+    """Render ``HTTPException`` errors in the ``ErrorResponse`` shape.
+
+    Routes raise ``HTTPException`` with ``detail={"error": ..., "message": ...}``,
+    which is sent as the response body as is. Any other detail falls back to
+    FastAPI's default ``{"detail": ...}`` response.
+
+    Args:
+        request: Incoming request.
+        exc: Raised HTTP exception.
+
+    Returns:
+        JSON error response.
+    """
+    if not isinstance(exc.detail, dict):
+        return await http_exception_handler(request, exc)
+
+    return ORJSONResponse(
+        status_code=exc.status_code, content=exc.detail, headers=exc.headers
+    )
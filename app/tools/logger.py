@@ -1,18 +1,36 @@
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+# The format below uses none of these record attributes, skip collecting them.
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+logging._srcfile = None
 
 os.makedirs("logs", exist_ok=True)
 logger = logging.getLogger("log-handler")
 logger.setLevel(logging.DEBUG)
+logger.propagate = False
 
 file_handler = RotatingFileHandler(
     "logs/log-handler.log", maxBytes=5 * 1024 * 1024, backupCount=5
 )
 formatter = logging.Formatter("[%(asctime)s] [%(levelname)s] %(name)s: %(message)s")
 file_handler.setFormatter(formatter)
-logger.addHandler(file_handler)
 
 console_handler = logging.StreamHandler()
 console_handler.setFormatter(formatter)
-logger.addHandler(console_handler)
+
+# Records are only queued on the calling thread (e.g. the event loop); file writes
+# and rotation happen on the listener thread.
+log_queue: queue.SimpleQueue = queue.SimpleQueue()
+logger.addHandler(QueueHandler(log_queue))
+
+listener = QueueListener(
+    log_queue, file_handler, console_handler, respect_handler_level=True
+)
+listener.start()
+atexit.register(listener.stop)
@@ -0,0 +1,31 @@
+from app.tools.custom_exceptions import InvalidTagFilterError
+
+
+def parse_tag_filters(tag_filters: list[str]) -> dict[str, list[str]]:
+    """Parse ``tag`` query values into a tag filter mapping.
+
+    ``key:value`` requires the tag to have that value, repeating a key accepts
+    any of the given values. A bare ``key`` only requires the tag to be present.
+
+    Args:
+        tag_filters: Raw ``tag`` query parameter values.
+
+    Returns:
+        Mapping of tag key to accepted values, empty for key-presence filters.
+
+    Raises:
+        InvalidTagFilterError: If a filter has an empty key.
+    """
+    tags: dict[str, list[str]] = {}
+
+    for tag_filter in tag_filters:
+        key, separator, value = tag_filter.partition(":")
+
+        if not key:
+            raise InvalidTagFilterError
+
+        values = tags.setdefault(key, [])
+        if separator:
+            values.append(value)
+
+    return tags
@@ -0,0 +1,15 @@
+from datetime import datetime, timezone
+
+
+def as_utc(moment: datetime) -> datetime:
+    """Convert a timestamp to UTC, treating naive values as UTC.
+
+    Args:
+        moment: Naive or timezone-aware timestamp.
+
+    Returns:
+        Timezone-aware timestamp in UTC.
+    """
+    if moment.tzinfo is None:
+        return moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc)
@@ -8,18 +8,153 @@ CREATE TABLE application(
 CREATE TYPE error_lvl AS ENUM ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL');
 
 CREATE TABLE event(
-    id BIGSERIAL PRIMARY KEY,
+    id BIGSERIAL NOT NULL,
     application_id BIGINT NOT NULL,
     occurred_at TIMESTAMPTZ NOT NULL,
     received_at TIMESTAMPTZ NOT NULL DEFAULT now(),
     level error_lvl NOT NULL,
     message VARCHAR(255) NOT NULL,
+    message_hash BIGINT GENERATED ALWAYS AS (hashtextextended(message, 0)) STORED,
     stack JSONB,
     tags JSONB,
 
+    PRIMARY KEY (id, received_at),
     CONSTRAINT fk_event_application
+        FOREIGN KEY (application_id) REFERENCES application(id) ON DELETE CASCADE,
+    CONSTRAINT ck_event_occurred_sane
+        CHECK (occurred_at <= received_at + interval '1 day')
+) PARTITION BY RANGE (received_at);
+
+-- Creates the monthly (UTC) partitions of event covering [since, until]. Rows that
+-- already landed in event_default for a missing month are moved into its partition.
+CREATE FUNCTION event_create_partitions(since TIMESTAMPTZ, until TIMESTAMPTZ) RETURNS void AS $$
+DECLARE
+    month_start TIMESTAMPTZ := date_trunc('month', since, 'UTC');
+    month_end TIMESTAMPTZ;
+    partition_name TEXT;
+BEGIN
+    WHILE month_start <= until LOOP
+        month_end := date_trunc('month', month_start + interval '32 days', 'UTC');
+        partition_name := 'event_' || to_char(month_start AT TIME ZONE 'UTC', 'YYYY_MM');
+
+        IF to_regclass(partition_name) IS NULL THEN
+            BEGIN
+                IF EXISTS (
+                    SELECT 1 FROM event_default
+                    WHERE received_at >= month_start AND received_at < month_end
+                ) THEN
+                    -- Keeps new rows for the month out of event_default until it is attached.
+                    LOCK TABLE event IN SHARE ROW EXCLUSIVE MODE;
+                    EXECUTE format(
+                        'CREATE TABLE %I (LIKE event INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING GENERATED)',
+                        partition_name
+                    );
+                    EXECUTE format(
+                        'WITH moved AS ('
+                        '    DELETE FROM event_default WHERE received_at >= %L AND received_at < %L'
+                        '    RETURNING id, application_id, occurred_at, received_at, level, message, stack, tags'
+                        ') '
+                        'INSERT INTO %I (id, application_id, occurred_at, received_at, level, message, stack, tags) '
+                        'SELECT * FROM moved',
+                        month_start,
+                        month_end,
+                        partition_name
+                    );
+                    EXECUTE format(
+                        'ALTER TABLE event ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                        partition_name,
+                        month_start,
+                        month_end
+                    );
+                ELSE
+                    EXECUTE format(
+                        'CREATE TABLE %I PARTITION OF event FOR VALUES FROM (%L) TO (%L)',
+                        partition_name,
+                        month_start,
+                        month_end
+                    );
+                END IF;
+            EXCEPTION
+                WHEN duplicate_table OR unique_violation THEN
+                    NULL;
+                -- A row for the month reached event_default meanwhile, it is moved on the next run.
+                WHEN check_violation THEN
+                    RAISE NOTICE 'event_default received rows for %, retrying later', month_start;
+            END;
+        END IF;
+
+        month_start := month_end;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TABLE event_default PARTITION OF event DEFAULT;
+SELECT event_create_partitions(now(), now() + interval '3 months');
+
+CREATE INDEX idx_event_application_id_received_at_id_level ON event(application_id, received_at DESC, id DESC, level);
+CREATE INDEX idx_event_application_id_occurred_at ON event(application_id, occurred_at);
+CREATE INDEX idx_event_tags ON event USING GIN (tags jsonb_path_ops);
+
+CREATE TABLE event_message_hourly(
+    application_id BIGINT NOT NULL,
+    bucket_hour TIMESTAMPTZ NOT NULL,
+    level error_lvl NOT NULL,
+    message VARCHAR(255) NOT NULL,
+    count BIGINT NOT NULL,
+    last_seen TIMESTAMPTZ NOT NULL,
+
+    PRIMARY KEY (application_id, bucket_hour, level, message),
+    CONSTRAINT fk_event_message_hourly_application
         FOREIGN KEY (application_id) REFERENCES application(id) ON DELETE CASCADE
 );
 
-CREATE INDEX idx_event_application_id_received_at ON event(application_id, received_at DESC);
-CREATE INDEX idx_event_application_id_occurred_at ON event(application_id, occurred_at);
+CREATE TABLE event_level_hourly(
+    application_id BIGINT NOT NULL,
+    bucket_hour TIMESTAMPTZ NOT NULL,
+    level error_lvl NOT NULL,
+    count BIGINT NOT NULL,
+
+    PRIMARY KEY (application_id, bucket_hour, level),
+    CONSTRAINT fk_event_level_hourly_application
+        FOREIGN KEY (application_id) REFERENCES application(id) ON DELETE CASCADE
+);
+
+-- Hours before rolled_up_until are complete in the hourly rollup tables, later ones
+-- are read from event.
+CREATE TABLE event_rollup_watermark(
+    id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),
+    rolled_up_until TIMESTAMPTZ NOT NULL
+);
+
+INSERT INTO event_rollup_watermark (rolled_up_until) VALUES (date_trunc('hour', now(), 'UTC'));
+
+-- Rolls up the UTC hours that ended at least settle ago and advances the watermark.
+-- Closed hours are only inserted once, so ingest never waits on rollup rows.
+CREATE FUNCTION event_rollup_hours(settle INTERVAL) RETURNS TIMESTAMPTZ AS $$
+DECLARE
+    since TIMESTAMPTZ;
+    until TIMESTAMPTZ := date_trunc('hour', now() - settle, 'UTC');
+BEGIN
+    SELECT rolled_up_until INTO since FROM event_rollup_watermark FOR UPDATE;
+
+    IF until <= since THEN
+        RETURN since;
+    END IF;
+
+    INSERT INTO event_level_hourly (application_id, bucket_hour, level, count)
+    SELECT application_id, date_trunc('hour', received_at, 'UTC'), level, count(*)
+    FROM event
+    WHERE received_at >= since AND received_at < until
+    GROUP BY 1, 2, 3;
+
+    INSERT INTO event_message_hourly (application_id, bucket_hour, level, message, count, last_seen)
+    SELECT application_id, date_trunc('hour', received_at, 'UTC'), level, message,
+           count(*), max(received_at)
+    FROM event
+    WHERE received_at >= since AND received_at < until
+    GROUP BY 1, 2, 3, 4;
+
+    UPDATE event_rollup_watermark SET rolled_up_until = until;
+    RETURN until;
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,11 @@
+-- Indexes backing the event listing and statistics endpoints.
+-- CONCURRENTLY cannot run inside a transaction block, run with autocommit (e.g. plain psql -f).
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_event_application_id_received_at_level
+    ON event(application_id, received_at DESC, level);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_event_tags
+    ON event USING GIN (tags jsonb_path_ops);
+
+-- Superseded by idx_event_application_id_received_at_level.
+DROP INDEX CONCURRENTLY IF EXISTS idx_event_application_id_received_at;
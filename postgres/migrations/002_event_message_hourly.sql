@@ -0,0 +1,49 @@
+-- Hourly per-message rollup backing GET /apps/{app_id}/stats/top-messages.
+-- The table lock keeps event inserts out until both the trigger and the backfill are in place.
+
+BEGIN;
+
+LOCK TABLE event IN SHARE ROW EXCLUSIVE MODE;
+
+CREATE TABLE event_message_hourly(
+    application_id BIGINT NOT NULL,
+    bucket_hour TIMESTAMPTZ NOT NULL,
+    level error_lvl NOT NULL,
+    message VARCHAR(255) NOT NULL,
+    count BIGINT NOT NULL,
+    last_seen TIMESTAMPTZ NOT NULL,
+
+    PRIMARY KEY (application_id, bucket_hour, level, message),
+    CONSTRAINT fk_event_message_hourly_application
+        FOREIGN KEY (application_id) REFERENCES application(id) ON DELETE CASCADE
+);
+
+-- Keeps event_message_hourly in sync with every INSERT into event (one upsert per statement).
+CREATE FUNCTION event_message_hourly_refresh() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO event_message_hourly AS rollup
+        (application_id, bucket_hour, level, message, count, last_seen)
+    SELECT application_id, date_trunc('hour', received_at, 'UTC'), level, message,
+           count(*), max(received_at)
+    FROM new_events
+    GROUP BY 1, 2, 3, 4
+    ORDER BY 1, 2, 3, 4
+    ON CONFLICT (application_id, bucket_hour, level, message) DO UPDATE
+        SET count = rollup.count + excluded.count,
+            last_seen = greatest(rollup.last_seen, excluded.last_seen);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_event_message_hourly_refresh
+    AFTER INSERT ON event
+    REFERENCING NEW TABLE AS new_events
+    FOR EACH STATEMENT EXECUTE FUNCTION event_message_hourly_refresh();
+
+INSERT INTO event_message_hourly (application_id, bucket_hour, level, message, count, last_seen)
+SELECT application_id, date_trunc('hour', received_at, 'UTC'), level, message,
+       count(*), max(received_at)
+FROM event
+GROUP BY 1, 2, 3, 4;
+
+COMMIT;
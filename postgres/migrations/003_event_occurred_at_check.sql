@@ -0,0 +1,9 @@
+-- Reject events whose occurred_at lies more than a day after they were received.
+-- NOT VALID skips the full table scan under the ACCESS EXCLUSIVE lock, VALIDATE
+-- then checks the existing rows holding only a SHARE UPDATE EXCLUSIVE lock.
+
+ALTER TABLE event
+    ADD CONSTRAINT ck_event_occurred_sane
+        CHECK (occurred_at <= received_at + interval '1 day') NOT VALID;
+
+ALTER TABLE event VALIDATE CONSTRAINT ck_event_occurred_sane;
@@ -0,0 +1,10 @@
+-- Keyset pagination orders by (received_at, id); adding id to the composite index
+-- serves that order without an extra sort. level stays as the last key column so
+-- level filters are still checked on the index.
+-- CONCURRENTLY cannot run inside a transaction block, run with autocommit (e.g. plain psql -f).
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_event_application_id_received_at_id_level
+    ON event(application_id, received_at DESC, id DESC, level);
+
+-- Superseded by idx_event_application_id_received_at_id_level.
+DROP INDEX CONCURRENTLY IF EXISTS idx_event_application_id_received_at_level;
@@ -0,0 +1,43 @@
+-- Hourly per-level rollup backing GET /apps/{app_id}/stats/timeseries and /stats/by-level.
+-- The table lock keeps event inserts out until both the trigger and the backfill are in place.
+
+BEGIN;
+
+LOCK TABLE event IN SHARE ROW EXCLUSIVE MODE;
+
+CREATE TABLE event_level_hourly(
+    application_id BIGINT NOT NULL,
+    bucket_hour TIMESTAMPTZ NOT NULL,
+    level error_lvl NOT NULL,
+    count BIGINT NOT NULL,
+
+    PRIMARY KEY (application_id, bucket_hour, level),
+    CONSTRAINT fk_event_level_hourly_application
+        FOREIGN KEY (application_id) REFERENCES application(id) ON DELETE CASCADE
+);
+
+-- Keeps event_level_hourly in sync with every INSERT into event (one upsert per statement).
+CREATE FUNCTION event_level_hourly_refresh() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO event_level_hourly AS rollup (application_id, bucket_hour, level, count)
+    SELECT application_id, date_trunc('hour', received_at, 'UTC'), level, count(*)
+    FROM new_events
+    GROUP BY 1, 2, 3
+    ORDER BY 1, 2, 3
+    ON CONFLICT (application_id, bucket_hour, level) DO UPDATE
+        SET count = rollup.count + excluded.count;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_event_level_hourly_refresh
+    AFTER INSERT ON event
+    REFERENCING NEW TABLE AS new_events
+    FOR EACH STATEMENT EXECUTE FUNCTION event_level_hourly_refresh();
+
+INSERT INTO event_level_hourly (application_id, bucket_hour, level, count)
+SELECT application_id, date_trunc('hour', received_at, 'UTC'), level, count(*)
+FROM event
+GROUP BY 1, 2, 3;
+
+COMMIT;
@@ -0,0 +1,6 @@
+-- Stored hash of event.message, used to group messages by a fixed-width key.
+-- Adding a stored generated column rewrites the table under an ACCESS EXCLUSIVE lock,
+-- run it in a maintenance window on large databases.
+
+ALTER TABLE event
+    ADD COLUMN message_hash BIGINT GENERATED ALWAYS AS (hashtextextended(message, 0)) STORED;
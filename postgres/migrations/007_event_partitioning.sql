@@ -0,0 +1,90 @@
+-- Converts event into a table range partitioned by month (UTC) of received_at.
+-- Every event is copied under an exclusive lock, run it in a maintenance window.
+-- The rollup tables are left untouched, the copy does not fire their triggers.
+
+BEGIN;
+
+LOCK TABLE event IN ACCESS EXCLUSIVE MODE;
+
+DROP TRIGGER trg_event_message_hourly_refresh ON event;
+DROP TRIGGER trg_event_level_hourly_refresh ON event;
+DROP INDEX IF EXISTS idx_event_application_id_received_at_id_level;
+DROP INDEX IF EXISTS idx_event_application_id_received_at_level;
+DROP INDEX IF EXISTS idx_event_application_id_occurred_at;
+DROP INDEX IF EXISTS idx_event_tags;
+ALTER TABLE event RENAME TO event_unpartitioned;
+ALTER INDEX event_pkey RENAME TO event_unpartitioned_pkey;
+
+CREATE TABLE event(
+    id BIGINT NOT NULL DEFAULT nextval('event_id_seq'),
+    application_id BIGINT NOT NULL,
+    occurred_at TIMESTAMPTZ NOT NULL,
+    received_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    level error_lvl NOT NULL,
+    message VARCHAR(255) NOT NULL,
+    message_hash BIGINT GENERATED ALWAYS AS (hashtextextended(message, 0)) STORED,
+    stack JSONB,
+    tags JSONB,
+
+    PRIMARY KEY (id, received_at),
+    CONSTRAINT fk_event_application
+        FOREIGN KEY (application_id) REFERENCES application(id) ON DELETE CASCADE,
+    CONSTRAINT ck_event_occurred_sane
+        CHECK (occurred_at <= received_at + interval '1 day')
+) PARTITION BY RANGE (received_at);
+
+ALTER SEQUENCE event_id_seq OWNED BY event.id;
+
+-- Creates the monthly (UTC) partitions of event covering [since, until].
+-- Months whose rows already landed in event_default are skipped with a warning.
+CREATE FUNCTION event_create_partitions(since TIMESTAMPTZ, until TIMESTAMPTZ) RETURNS void AS $$
+DECLARE
+    month_start TIMESTAMPTZ := date_trunc('month', since, 'UTC');
+    month_end TIMESTAMPTZ;
+BEGIN
+    WHILE month_start <= until LOOP
+        month_end := date_trunc('month', month_start + interval '32 days', 'UTC');
+        BEGIN
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS %I PARTITION OF event FOR VALUES FROM (%L) TO (%L)',
+                'event_' || to_char(month_start AT TIME ZONE 'UTC', 'YYYY_MM'),
+                month_start,
+                month_end
+            );
+        EXCEPTION
+            WHEN duplicate_table OR unique_violation THEN
+                NULL;
+            WHEN check_violation THEN
+                RAISE WARNING 'event_default holds rows for %, partition not created', month_start;
+        END;
+        month_start := month_end;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TABLE event_default PARTITION OF event DEFAULT;
+
+SELECT event_create_partitions(coalesce(min(received_at), now()), now() + interval '3 months')
+FROM event_unpartitioned;
+
+INSERT INTO event (id, application_id, occurred_at, received_at, level, message, stack, tags)
+SELECT id, application_id, occurred_at, received_at, level, message, stack, tags
+FROM event_unpartitioned;
+
+DROP TABLE event_unpartitioned;
+
+CREATE INDEX idx_event_application_id_received_at_id_level ON event(application_id, received_at DESC, id DESC, level);
+CREATE INDEX idx_event_application_id_occurred_at ON event(application_id, occurred_at);
+CREATE INDEX idx_event_tags ON event USING GIN (tags jsonb_path_ops);
+
+CREATE TRIGGER trg_event_message_hourly_refresh
+    AFTER INSERT ON event
+    REFERENCING NEW TABLE AS new_events
+    FOR EACH STATEMENT EXECUTE FUNCTION event_message_hourly_refresh();
+
+CREATE TRIGGER trg_event_level_hourly_refresh
+    AFTER INSERT ON event
+    REFERENCING NEW TABLE AS new_events
+    FOR EACH STATEMENT EXECUTE FUNCTION event_level_hourly_refresh();
+
+COMMIT;
@@ -0,0 +1,46 @@
+-- Moves event_message_hourly from a per-insert trigger to a periodic job over closed hours.
+-- Rows for the current hour are dropped, it is read from event until the job rolls it up.
+-- The table lock makes sure every earlier hour was counted by the trigger.
+
+BEGIN;
+
+LOCK TABLE event IN SHARE ROW EXCLUSIVE MODE;
+
+DROP TRIGGER trg_event_message_hourly_refresh ON event;
+DROP FUNCTION event_message_hourly_refresh();
+
+CREATE TABLE event_rollup_watermark(
+    id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),
+    rolled_up_until TIMESTAMPTZ NOT NULL
+);
+
+INSERT INTO event_rollup_watermark (rolled_up_until) VALUES (date_trunc('hour', now(), 'UTC'));
+
+DELETE FROM event_message_hourly WHERE bucket_hour >= date_trunc('hour', now(), 'UTC');
+
+-- Rolls up the UTC hours that ended at least settle ago and advances the watermark.
+-- Closed hours are only inserted once, so ingest never waits on rollup rows.
+CREATE FUNCTION event_rollup_hours(settle INTERVAL) RETURNS TIMESTAMPTZ AS $$
+DECLARE
+    since TIMESTAMPTZ;
+    until TIMESTAMPTZ := date_trunc('hour', now() - settle, 'UTC');
+BEGIN
+    SELECT rolled_up_until INTO since FROM event_rollup_watermark FOR UPDATE;
+
+    IF until <= since THEN
+        RETURN since;
+    END IF;
+
+    INSERT INTO event_message_hourly (application_id, bucket_hour, level, message, count, last_seen)
+    SELECT application_id, date_trunc('hour', received_at, 'UTC'), level, message,
+           count(*), max(received_at)
+    FROM event
+    WHERE received_at >= since AND received_at < until
+    GROUP BY 1, 2, 3, 4;
+
+    UPDATE event_rollup_watermark SET rolled_up_until = until;
+    RETURN until;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMIT;
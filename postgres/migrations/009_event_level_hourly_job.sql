@@ -0,0 +1,47 @@
+-- Moves event_level_hourly from a per-insert trigger to the periodic event_rollup_hours job.
+-- Rows from the watermark on are dropped, they are read from event until the job rolls them up.
+-- The table lock makes sure every earlier hour was counted by the trigger.
+
+BEGIN;
+
+LOCK TABLE event IN SHARE ROW EXCLUSIVE MODE;
+LOCK TABLE event_rollup_watermark IN EXCLUSIVE MODE;
+
+DROP TRIGGER trg_event_level_hourly_refresh ON event;
+DROP FUNCTION event_level_hourly_refresh();
+
+DELETE FROM event_level_hourly
+WHERE bucket_hour >= (SELECT rolled_up_until FROM event_rollup_watermark);
+
+-- Rolls up the UTC hours that ended at least settle ago and advances the watermark.
+-- Closed hours are only inserted once, so ingest never waits on rollup rows.
+CREATE OR REPLACE FUNCTION event_rollup_hours(settle INTERVAL) RETURNS TIMESTAMPTZ AS $$
+DECLARE
+    since TIMESTAMPTZ;
+    until TIMESTAMPTZ := date_trunc('hour', now() - settle, 'UTC');
+BEGIN
+    SELECT rolled_up_until INTO since FROM event_rollup_watermark FOR UPDATE;
+
+    IF until <= since THEN
+        RETURN since;
+    END IF;
+
+    INSERT INTO event_level_hourly (application_id, bucket_hour, level, count)
+    SELECT application_id, date_trunc('hour', received_at, 'UTC'), level, count(*)
+    FROM event
+    WHERE received_at >= since AND received_at < until
+    GROUP BY 1, 2, 3;
+
+    INSERT INTO event_message_hourly (application_id, bucket_hour, level, message, count, last_seen)
+    SELECT application_id, date_trunc('hour', received_at, 'UTC'), level, message,
+           count(*), max(received_at)
+    FROM event
+    WHERE received_at >= since AND received_at < until
+    GROUP BY 1, 2, 3, 4;
+
+    UPDATE event_rollup_watermark SET rolled_up_until = until;
+    RETURN until;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMIT;
@@ -0,0 +1,70 @@
+-- event_create_partitions now runs periodically from the application. It skips existing
+-- partitions without taking locks and moves rows out of event_default instead of
+-- leaving a month unpartitioned.
+
+BEGIN;
+
+-- Creates the monthly (UTC) partitions of event covering [since, until]. Rows that
+-- already landed in event_default for a missing month are moved into its partition.
+CREATE OR REPLACE FUNCTION event_create_partitions(since TIMESTAMPTZ, until TIMESTAMPTZ) RETURNS void AS $$
+DECLARE
+    month_start TIMESTAMPTZ := date_trunc('month', since, 'UTC');
+    month_end TIMESTAMPTZ;
+    partition_name TEXT;
+BEGIN
+    WHILE month_start <= until LOOP
+        month_end := date_trunc('month', month_start + interval '32 days', 'UTC');
+        partition_name := 'event_' || to_char(month_start AT TIME ZONE 'UTC', 'YYYY_MM');
+
+        IF to_regclass(partition_name) IS NULL THEN
+            BEGIN
+                IF EXISTS (
+                    SELECT 1 FROM event_default
+                    WHERE received_at >= month_start AND received_at < month_end
+                ) THEN
+                    -- Keeps new rows for the month out of event_default until it is attached.
+                    LOCK TABLE event IN SHARE ROW EXCLUSIVE MODE;
+                    EXECUTE format(
+                        'CREATE TABLE %I (LIKE event INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING GENERATED)',
+                        partition_name
+                    );
+                    EXECUTE format(
+                        'WITH moved AS ('
+                        '    DELETE FROM event_default WHERE received_at >= %L AND received_at < %L'
+                        '    RETURNING id, application_id, occurred_at, received_at, level, message, stack, tags'
+                        ') '
+                        'INSERT INTO %I (id, application_id, occurred_at, received_at, level, message, stack, tags) '
+                        'SELECT * FROM moved',
+                        month_start,
+                        month_end,
+                        partition_name
+                    );
+                    EXECUTE format(
+                        'ALTER TABLE event ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                        partition_name,
+                        month_start,
+                        month_end
+                    );
+                ELSE
+                    EXECUTE format(
+                        'CREATE TABLE %I PARTITION OF event FOR VALUES FROM (%L) TO (%L)',
+                        partition_name,
+                        month_start,
+                        month_end
+                    );
+                END IF;
+            EXCEPTION
+                WHEN duplicate_table OR unique_violation THEN
+                    NULL;
+                -- A row for the month reached event_default meanwhile, it is moved on the next run.
+                WHEN check_violation THEN
+                    RAISE NOTICE 'event_default received rows for %, retrying later', month_start;
+            END;
+        END IF;
+
+        month_start := month_end;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMIT;